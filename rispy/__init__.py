@@ -1,7 +1,7 @@
 """A Python reader/writer of RIS reference files"""
 
 from .config import LIST_TYPE_TAGS, TAG_KEY_MAPPING, TYPE_OF_REFERENCE_MAPPING
-from .parser import BaseParser, RisParser, WokParser, load, loads
+from .parser import BaseParser, RisParser, WokParser, iload, load, loads
 from .writer import BaseWriter, RisWriter, dump, dumps
 
 __version__ = "0.9.0"
@@ -12,6 +12,7 @@ __all__ = [
     "TAG_KEY_MAPPING",
     "TYPE_OF_REFERENCE_MAPPING",
     "load",
+    "iload",
     "loads",
     "dump",
     "dumps",
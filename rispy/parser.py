@@ -1,10 +1,11 @@
 """RIS Parser."""
 
 import re
+import string
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from pathlib import Path
-from typing import ClassVar, Dict, List, Optional, TextIO, Type, Union
+from typing import ClassVar, Dict, Iterator, List, Optional, TextIO, Type, Union
 
 from .config import (
     DELIMITED_TAG_MAPPING,
@@ -14,7 +15,10 @@ from .config import (
     WOK_TAG_KEY_MAPPING,
 )
 
-__all__ = ["load", "loads", "BaseParser", "WokParser", "RisParser"]
+__all__ = ["load", "iload", "loads", "BaseParser", "WokParser", "RisParser"]
+
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_UPPERCASE_DIGITS = frozenset(string.ascii_uppercase + string.digits)
 
 
 class NextLine(Exception):
@@ -82,6 +86,10 @@ class BaseParser(ABC):
     ):
         """Initialize the parser function.
 
+        `mapping`, `list_tags`, `delimiter_tags_mapping` and `ignore` are read
+        once, when the parser is created; changing the corresponding attributes
+        afterwards has no effect on parsing.
+
         Args:
             mapping (dict, optional): Map tags to tag names.
             list_tags (list, optional): List of list-type tags.
@@ -125,6 +133,19 @@ class BaseParser(ABC):
         self.enforce_list_tags = enforce_list_tags
         self.newline = newline if newline is not None else self.DEFAULT_NEWLINE
 
+        # key, delimiter and list flag for each mapped tag, resolved once for `_add_tag`
+        list_tags = frozenset(self.list_tags)
+        self._tag_info = {
+            tag: (name, self.delimiter_map.get(tag), tag in list_tags)
+            for tag, name in self.mapping.items()
+        }
+        self._ignore = frozenset(self.ignore)
+
+        # a fast `is_tag` only knows the `PATTERN` of the class defining it;
+        # subclasses that change `PATTERN` are matched with the regex instead
+        is_tag_owner = next(cls for cls in type(self).__mro__ if "is_tag" in vars(cls))
+        self._match_pattern = self.PATTERN != is_tag_owner.PATTERN
+
     def parse(self, text: str) -> List[Dict]:
         """Parse RIS string."""
         lines = text.split(self.newline)
@@ -140,20 +161,26 @@ class BaseParser(ABC):
         self.last_tag = None
         self.line_number = -1
 
-        for line in lines:
-            self.line_number += 1
+        # bound once; these are called for every line
+        clean_text = self.clean_text
+        is_tag = self.is_tag
+        parse_tag = self._parse_tag
+        parse_other = self._parse_other
 
-            if self.line_number == 0:
+        for line_number, line in enumerate(lines):
+            self.line_number = line_number
+
+            if line_number == 0:
                 line = self.clean_start(line)
 
-            line = self.clean_text(line)
+            line = clean_text(line)
 
-            if not line.strip():
+            if not line or line.isspace():
                 continue
 
-            if self.is_tag(line):
+            if is_tag(line):
                 try:
-                    yield self._parse_tag(line)
+                    yield parse_tag(line)
                     self.current = {}
                     self.in_ref = False
                     self.last_tag = None
@@ -161,13 +188,13 @@ class BaseParser(ABC):
                     continue
             else:
                 try:
-                    yield self._parse_other(line)
+                    yield parse_other(line)
                 except NextLine:
                     continue
 
     def _parse_tag(self, line):
         tag = self.get_tag(line)
-        if tag in self.ignore:
+        if tag in self._ignore:
             raise NextLine
 
         if tag == self.END_TAG:
@@ -184,7 +211,7 @@ class BaseParser(ABC):
         if not self.in_ref:
             raise ParseError(f"Invalid start tag in line {self.line_number}:\n {line}")
 
-        if tag in self.mapping:
+        if tag in self._tag_info:
             self._add_tag(tag, line)
             raise NextLine
         elif not self.skip_unknown_tags:
@@ -231,29 +258,26 @@ class BaseParser(ABC):
     def _add_list_value(self, name, value):
         """Process tags with multiple values."""
         value_list = value if isinstance(value, list) else [value]
-        try:
-            self.current[name].extend(value_list)
-        except KeyError:
+        existing = self.current.get(name)
+        if existing is None:
             self.current[name] = value_list
-        except AttributeError:
-            if not isinstance(self.current[name], str):
-                raise
-            must_exist = self.current[name]
-            self.current[name] = [must_exist, *value_list]
+        elif isinstance(existing, str):
+            self.current[name] = [existing, *value_list]
+        else:
+            existing.extend(value_list)
 
     def _add_tag(self, tag, line, all_line=False):
         self.last_tag = tag
-        name = self.mapping[tag]
+        name, delimiter, is_list = self._tag_info[tag]
         if all_line:
             new_value = line.strip()
         else:
             new_value = self.get_content(line)
 
-        delimiter = self.delimiter_map.get(tag)
         if delimiter is not None:
             new_value = [i.strip() for i in new_value.split(delimiter)]
 
-        if tag in self.list_tags:
+        if is_list:
             self._add_list_value(name, new_value)
         else:
             self._add_single_value(name, new_value, is_multi=all_line)
@@ -311,6 +335,14 @@ class WokParser(BaseParser):
     def get_content(self, line):
         return line[2:].strip()
 
+    def is_tag(self, line):
+        if self._match_pattern:
+            return bool(self.pattern.match(line))
+        # same language as `PATTERN`, checked without running the regex engine
+        return (
+            line[2:3] == " " and line[0] in _UPPERCASE and line[1] in _UPPERCASE_DIGITS
+        ) or line.startswith(("ER", "EF"))
+
     def is_header(self, line):
         return True
 
@@ -329,6 +361,14 @@ class RisParser(BaseParser):
     def get_content(self, line):
         return line[6:].strip()
 
+    def is_tag(self, line):
+        if self._match_pattern:
+            return bool(self.pattern.match(line))
+        # same language as `PATTERN`, checked without running the regex engine
+        if line[2:6] == "  - ":
+            return line[0] in _UPPERCASE and line[1] in _UPPERCASE_DIGITS
+        return line.startswith("ER  -") and (len(line) == 5 or line[5:].isspace())
+
     def is_header(self, line):
         none_or_match = self.counter_re.match(line)
         return bool(none_or_match)
@@ -363,22 +403,58 @@ def load(
     Returns:
         list: Returns list of RIS entries.
     """
+    return list(
+        iload(file, encoding=encoding, newline=newline, implementation=implementation, **kw)
+    )
+
+
+def iload(
+    file: Union[TextIO, Path],
+    *,
+    encoding: Optional[str] = None,
+    newline: Optional[str] = None,
+    implementation: Optional[Type[BaseParser]] = None,
+    **kw,
+) -> Iterator[Dict]:
+    """Load a RIS file and return an iterator over its entries.
+
+    Accepts the same arguments as `load`, but entries are parsed as they
+    are consumed. For a Path or a file object with `readline`, lines are read
+    lazily too, so only the current entry is kept in memory; other objects
+    with `read` are read in full up front. When a Path is supplied, the file
+    stays open until the iterator is exhausted.
+
+    Args:
+        file (Union[TextIO, Path]): File handle to read ris formatted data.
+        encoding(str, optional): File encoding, only used when a Path is supplied.
+        newline(str, optional): File line separator.
+        implementation (RisImplementation): RIS implementation; base by
+                                            default.
+
+    Returns:
+        iterator: Yields RIS entries.
+    """
     if implementation is None:
         parser = RisParser
     else:
         parser = implementation
 
     if hasattr(file, "readline"):
-        return parser(newline=newline, **kw).parse_lines(file)
+        return parser(newline=newline, **kw)._yield_lines(file)
     elif hasattr(file, "open"):
-        with file.open(mode="r", newline=newline, encoding=encoding) as f:
-            return parser(**kw).parse_lines(f)
+        return _iter_path(file, parser(**kw), newline=newline, encoding=encoding)
     elif hasattr(file, "read"):
-        return loads(file.read(), implementation=implementation, newline=newline, **kw)
+        instance = parser(newline=newline, **kw)
+        return instance._yield_lines(file.read().split(instance.newline))
     else:
         raise ValueError("File must be a file-like object or a Path object")
 
 
+def _iter_path(path: Path, parser: BaseParser, **open_kw) -> Iterator[Dict]:
+    with path.open(mode="r", **open_kw) as f:
+        yield from parser._yield_lines(f)
+
+
 def loads(text: str, *, implementation: Optional[Type[BaseParser]] = None, **kw) -> List[Dict]:
     """Load a RIS file and return a list of entries.
 
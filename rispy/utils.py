@@ -49,4 +49,5 @@ def convert_reference_types(
     if not reverse:
         return [convert(r) for r in deepcopy(reference_list)]
     else:
-        return [convert(r, invert_dictionary(type_map)) for r in deepcopy(reference_list)]
+        reverse_map = invert_dictionary(type_map)
+        return [convert(r, reverse_map) for r in deepcopy(reference_list)]
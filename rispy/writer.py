@@ -1,9 +1,9 @@
 """RIS Writer."""
 
 import warnings
-from abc import ABC
 from pathlib import Path
-from typing import ClassVar, Dict, List, Optional, TextIO, Type, Union
+from string import Formatter
+from typing import ClassVar, Dict, Iterable, Iterator, List, Optional, TextIO, Type, Union
 
 from .config import DELIMITED_TAG_MAPPING, LIST_TYPE_TAGS, TAG_KEY_MAPPING
 from .utils import invert_dictionary
@@ -11,7 +11,7 @@ from .utils import invert_dictionary
 __all__ = ["dump", "dumps", "BaseWriter", "RisWriter"]
 
 
-class BaseWriter(ABC):
+class BaseWriter:
     """Base writer class. Create a subclass to use.
 
     When creating a new implementation class, some variables and classes need
@@ -85,39 +85,108 @@ class BaseWriter(ABC):
         )
         self.ignore = ignore if ignore is not None else self.DEFAULT_IGNORE
         self._rev_mapping = invert_dictionary(self.mapping)
+        # prefix, infix and suffix of a plain `{tag}...{value}` PATTERN, else None;
+        # lines are only built without `_format_line` if a subclass keeps it
+        if type(self)._format_line is BaseWriter._format_line:
+            self._line_parts = self._split_pattern(self.PATTERN)
+        else:
+            self._line_parts = None
+        self._end_line = self._format_line(self.END_TAG)
         self.skip_unknown_tags = skip_unknown_tags
         self.enforce_list_tags = enforce_list_tags
 
-    def _get_reference_type(self, ref):
-        if self.REFERENCE_TYPE_KEY in ref:
-            # TODO add check
-            return ref[self.REFERENCE_TYPE_KEY]
+        # sets for the per-tag membership tests in `_format_reference`
+        self._list_tags_set = frozenset(self.list_tags)
+        tags_to_skip = [self.START_TAG, *self.ignore]
+        if self.skip_unknown_tags:
+            tags_to_skip.append(self.UNKNOWN_TAG)
+        self._tags_to_skip = frozenset(tags_to_skip)
 
-        if self.DEFAULT_REFERENCE_TYPE is not None:
-            return self.DEFAULT_REFERENCE_TYPE
-        else:
+    def _get_reference_type(self, ref):
+        reference_type = ref.get(self.REFERENCE_TYPE_KEY)
+        if reference_type is None:
+            reference_type = self.DEFAULT_REFERENCE_TYPE
+        if reference_type is None:
             raise ValueError("Unknown type of reference")
+        return reference_type
+
+    @staticmethod
+    def _split_pattern(pattern):
+        """Split a line pattern into the literal text around `tag` and `value`.
+
+        Returns `None` for patterns that need `str.format`, e.g. ones with a
+        format spec or with `value` before `tag`.
+        """
+        segments = [""]
+        fields = []
+        for literal, name, spec, conversion in Formatter().parse(pattern):
+            segments[-1] += literal
+            if name is not None:
+                fields.append((name, spec, conversion))
+                segments.append("")
+        if fields != [("tag", "", None), ("value", "", None)]:
+            return None
+        return tuple(segments)
 
     def _format_line(self, tag, value=""):
         """Format a RIS line."""
-        return self.PATTERN.format(tag=tag, value=value)
+        affixes = self._line_affixes(tag)
+        if affixes is None:
+            return self.PATTERN.format(tag=tag, value=value)
+        prefix, suffix = affixes
+        return f"{prefix}{value}{suffix}"
 
-    def _format_reference(self, ref, count, n):
-        header = self.set_header(count)
-        if header is not None:
-            yield header
-        yield self._format_line(self.START_TAG, self._get_reference_type(ref))
+    def _line_affixes(self, tag):
+        """Return the text before and after the value of a line with `tag`.
 
-        tags_to_skip = [self.START_TAG, *self.ignore]
-        if self.skip_unknown_tags:
-            tags_to_skip.append(self.UNKNOWN_TAG)
+        Returns `None` when lines have to be built by `_format_line`.
+        """
+        if self._line_parts is None:
+            return None
+        prefix, infix, suffix = self._line_parts
+        return f"{prefix}{tag}{infix}", suffix
+
+    def _format_list_lines(self, out, tag, values):
+        """Append one RIS line per value to `out`, all with the same tag."""
+        affixes = self._line_affixes(tag)
+        if affixes is None:
+            format_line = self._format_line
+            out.extend([format_line(tag, value) for value in values])
+        else:
+            prefix, suffix = affixes
+            out.extend([f"{prefix}{value}{suffix}" for value in values])
+
+    def _format_reference(self, out, ref, count, unknown_labels):
+        """Append the lines of a single reference to `out`.
 
+        Labels that cannot be exported are added to `unknown_labels`, and a
+        warning is only issued the first time a label is seen.
+        """
+        append = out.append
+        header = self.set_header(count)
+        if header is not None:
+            append(header)
+        append(self._format_line(self.START_TAG, self._get_reference_type(ref)))
+
+        line_parts = self._line_parts
+        prefix, infix, suffix = line_parts or ("", "", "")
+        format_line = self._format_line
+        get_tag = self._rev_mapping.get
+        tags_to_skip = self._tags_to_skip
+        list_tags = self._list_tags_set
+        enforce_list_tags = self.enforce_list_tags
+        get_delimiter = self.delimiter_map.get
         for label, value in ref.items():
+            # labels are usually already lowercase; only lowercase on a miss
+            tag = get_tag(label)
+            if tag is None:
+                tag = get_tag(label.lower())
+
             # not available
-            try:
-                tag = self._rev_mapping[label.lower()]
-            except KeyError:
-                warnings.warn(UserWarning(f"label `{label}` not exported"), stacklevel=2)
+            if tag is None:
+                if label not in unknown_labels:
+                    unknown_labels.add(label)
+                    warnings.warn(f"label `{label}` not exported", UserWarning, stacklevel=2)
                 continue
 
             # ignore
@@ -125,46 +194,47 @@ class BaseWriter(ABC):
                 continue
 
             # list tag
-            if tag in self.list_tags or (not self.enforce_list_tags and isinstance(value, list)):
-                for val_i in value:
-                    yield self._format_line(tag, val_i)
+            if tag in list_tags or (not enforce_list_tags and isinstance(value, list)):
+                self._format_list_lines(out, tag, value)
 
             # unknown tag(s), which are lists held in a defaultdict
             elif tag == self.UNKNOWN_TAG:
                 for unknown_tag in value.keys():
-                    for val_i in value[unknown_tag]:
-                        yield self._format_line(unknown_tag, val_i)
-
-            # write delimited tags
-            elif tag in self.delimiter_map:
-                combined_val = self.delimiter_map[tag].join(value)
-                yield self._format_line(tag, combined_val)
+                    self._format_list_lines(out, unknown_tag, value[unknown_tag])
 
-            # all non-list tags
+            # all non-list tags; delimited tags are joined into one line
             else:
-                yield self._format_line(tag, value)
+                if (delimiter := get_delimiter(tag)) is not None:
+                    value = delimiter.join(value)
+                if line_parts is None:
+                    append(format_line(tag, value))
+                else:
+                    append(f"{prefix}{tag}{infix}{value}{suffix}")
 
-        yield self._format_line(self.END_TAG)
+        append(self._end_line)
 
-        if self.SEPARATOR is not None and count < n:
-            yield self.SEPARATOR
+    def iter_format(self, references: Iterable[Dict]) -> Iterator[str]:
+        """Format references lazily, yielding the RIS text of one reference at a time.
 
-    def _yield_lines(self, references, extra_line=False):
-        n = len(references)
-        for i, ref in enumerate(references):
-            yield from self._format_reference(ref, count=i + 1, n=n)
-        if extra_line:
-            yield ""
+        Every yielded chunk ends with a newline; joining them gives the same
+        result as `formats`.
+        """
+        unknown_labels = set()
+        for count, ref in enumerate(references, start=1):
+            lines = []
+            if self.SEPARATOR is not None and count > 1:
+                lines.append(self.SEPARATOR)
+            self._format_reference(lines, ref, count=count, unknown_labels=unknown_labels)
+            lines.append("")
+            yield self.NEWLINE.join(lines)
 
     def format_lines(self, file, references):
         """Write references to a file."""
-        for line in self._yield_lines(references):
-            file.write(f"{line}{self.NEWLINE}")
+        file.writelines(self.iter_format(references))
 
-    def formats(self, references: List[Dict]) -> str:
+    def formats(self, references: Iterable[Dict]) -> str:
         """Format a list of references into an RIS string."""
-        lines = self._yield_lines(references, extra_line=True)
-        return self.NEWLINE.join(lines)
+        return "".join(self.iter_format(references))
 
     def set_header(self, count: int) -> Optional[str]:
         """Create the header for each reference."""
@@ -185,7 +255,7 @@ class RisWriter(BaseWriter):
 
 
 def dump(
-    references: List[Dict],
+    references: Iterable[Dict],
     file: Union[TextIO, Path],
     *,
     encoding: Optional[str] = None,
@@ -201,7 +271,7 @@ def dump(
     of strings.
 
     Args:
-        references (List[Dict]): List of references.
+        references (Iterable[Dict]): List or other iterable of references.
         file (TextIO): File handle to store ris formatted data.
         encoding (str, optional): Encoding to use when opening file.
         implementation (RisImplementation): RIS implementation; base by
@@ -222,7 +292,7 @@ def dump(
 
 
 def dumps(
-    references: List[Dict], *, implementation: Optional[Type[BaseWriter]] = None, **kw
+    references: Iterable[Dict], *, implementation: Optional[Type[BaseWriter]] = None, **kw
 ) -> str:
     """Return an RIS formatted string.
 
@@ -233,7 +303,7 @@ def dumps(
     of strings.
 
     Args:
-        references (List[Dict]): List of references.
+        references (Iterable[Dict]): List or other iterable of references.
         implementation (RisImplementation): RIS implementation; base by
                                             default.
     """
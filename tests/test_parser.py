@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 import pytest
@@ -6,6 +7,51 @@ import rispy
 
 DATA_DIR = Path(__file__).parent.resolve() / "data"
 
+EXAMPLE_FULL_ENTRIES = [
+    {
+        "type_of_reference": "JOUR",
+        "id": "12345",
+        "primary_title": "Title of reference",
+        "first_authors": ["Marx, Karl", "Lindgren, Astrid"],
+        "secondary_authors": ["Glattauer, Daniel"],
+        "publication_year": "2014//",
+        "notes_abstract": "BACKGROUND: Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
+        "keywords": ["Pippi", "Nordwind", "Piraten"],
+        "alternate_title3": "Lorem",
+        "alternate_title2": "lorem",
+        "volume": "9",
+        "number": "3",
+        "start_page": "e0815",
+        "place_published": "United States",
+        "publisher": "Fun Factory",
+        "issn": "1932-6208",
+        "note": "1008150341",
+        "file_attachments2": "http://example.com",
+        "urls": ["http://example_url.com"],
+    },
+    {
+        "type_of_reference": "JOUR",
+        "id": "12345",
+        "primary_title": "The title of the reference",
+        "first_authors": ["Marxus, Karlus", "Lindgren, Astrid"],
+        "secondary_authors": ["Glattauer, Daniel"],
+        "publication_year": "2006//",
+        "notes_abstract": "BACKGROUND: Lorem dammed ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
+        "keywords": ["Pippi Langstrumpf", "Nordwind", "Piraten"],
+        "alternate_title3": "Lorem",
+        "alternate_title2": "lorem",
+        "volume": "6",
+        "number": "3",
+        "start_page": "e0815341",
+        "place_published": "Germany",
+        "publisher": "Dark Factory",
+        "issn": "1732-4208",
+        "note": "1228150341",
+        "file_attachments2": "http://example2.com",
+        "urls": ["http://example_url.com"],
+    },
+]
+
 
 def test_load_example_basic_ris():
     filepath = DATA_DIR / "example_basic.ris"
@@ -31,218 +77,76 @@ def test_load_example_basic_ris():
     assert expected == entries[0]
 
 
-def test_load_multiline_ris():
-    filepath = DATA_DIR / "multiline.ris"
-    expected = {
-        "type_of_reference": "JOUR",
-        "authors": ["Shannon,Claude E."],
-        "year": "1948/07//",
-        "title": "A Mathematical Theory of Communication",
-        "alternate_title3": "Bell System Technical Journal",
-        "start_page": "379",
-        "end_page": "423",
-        "notes_abstract": "first line, then second line and at the end the last line",
-        "notes": ["first line", "* second line", "* last line"],
-        "volume": "27",
-    }
-    with open(filepath) as f:
-        entries = rispy.load(f)
-
-    assert expected == entries[0]
-
-
-def test_load_example_full_ris():
-    filepath = DATA_DIR / "example_full.ris"
-    expected = [
-        {
-            "type_of_reference": "JOUR",
-            "id": "12345",
-            "primary_title": "Title of reference",
-            "first_authors": ["Marx, Karl", "Lindgren, Astrid"],
-            "secondary_authors": ["Glattauer, Daniel"],
-            "publication_year": "2014//",
-            "notes_abstract": "BACKGROUND: Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
-            "keywords": ["Pippi", "Nordwind", "Piraten"],
-            "alternate_title3": "Lorem",
-            "alternate_title2": "lorem",
-            "volume": "9",
-            "number": "3",
-            "start_page": "e0815",
-            "place_published": "United States",
-            "publisher": "Fun Factory",
-            "issn": "1932-6208",
-            "note": "1008150341",
-            "file_attachments2": "http://example.com",
-            "urls": ["http://example_url.com"],
-        },
-        {
-            "type_of_reference": "JOUR",
-            "id": "12345",
-            "primary_title": "The title of the reference",
-            "first_authors": ["Marxus, Karlus", "Lindgren, Astrid"],
-            "secondary_authors": ["Glattauer, Daniel"],
-            "publication_year": "2006//",
-            "notes_abstract": "BACKGROUND: Lorem dammed ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
-            "keywords": ["Pippi Langstrumpf", "Nordwind", "Piraten"],
-            "alternate_title3": "Lorem",
-            "alternate_title2": "lorem",
-            "volume": "6",
-            "number": "3",
-            "start_page": "e0815341",
-            "place_published": "Germany",
-            "publisher": "Dark Factory",
-            "issn": "1732-4208",
-            "note": "1228150341",
-            "file_attachments2": "http://example2.com",
-            "urls": ["http://example_url.com"],
-        },
-    ]
-
-    with open(filepath) as f:
-        entries = rispy.load(f)
-    assert expected == entries
-
-
-def test_load_example_extraneous_data_ris():
-    filepath = DATA_DIR / "example_extraneous_data.ris"
-    expected = [
-        {
-            "type_of_reference": "JOUR",
-            "id": "12345",
-            "primary_title": "Title of reference",
-            "first_authors": ["Marx, Karl", "Lindgren, Astrid"],
-            "secondary_authors": ["Glattauer, Daniel"],
-            "publication_year": "2014//",
-            "notes_abstract": "BACKGROUND: Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
-            "keywords": ["Pippi", "Nordwind", "Piraten"],
-            "alternate_title3": "Lorem",
-            "alternate_title2": "lorem",
-            "volume": "9",
-            "number": "3",
-            "start_page": "e0815",
-            "place_published": "United States",
-            "publisher": "Fun Factory",
-            "issn": "1932-6208",
-            "note": "1008150341",
-            "file_attachments2": "http://example.com",
-            "urls": ["http://example_url.com"],
-        },
-        {
-            "type_of_reference": "JOUR",
-            "id": "12345",
-            "primary_title": "The title of the reference",
-            "first_authors": ["Marxus, Karlus", "Lindgren, Astrid"],
-            "secondary_authors": ["Glattauer, Daniel"],
-            "publication_year": "2006//",
-            "notes_abstract": "BACKGROUND: Lorem dammed ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
-            "keywords": ["Pippi Langstrumpf", "Nordwind", "Piraten"],
-            "alternate_title3": "Lorem",
-            "alternate_title2": "lorem",
-            "volume": "6",
-            "number": "3",
-            "start_page": "e0815341",
-            "place_published": "Germany",
-            "publisher": "Dark Factory",
-            "issn": "1732-4208",
-            "note": "1228150341",
-            "file_attachments2": "http://example2.com",
-            "urls": ["http://example_url.com"],
-        },
-    ]
-
-    with open(filepath) as f:
-        entries = rispy.load(f, skip_missing_tags=True)
-    assert expected == entries
-
-
-def test_load_example_full_ris_without_whitespace():
-    # Parse files without whitespace after ER tag.
-    # Resolves https://github.com/MrTango/rispy/pull/25
-
-    filepath = DATA_DIR / "example_full_without_whitespace.ris"
-    expected = [
-        {
-            "type_of_reference": "JOUR",
-            "id": "12345",
-            "primary_title": "Title of reference",
-            "first_authors": ["Marx, Karl", "Lindgren, Astrid"],
-            "secondary_authors": ["Glattauer, Daniel"],
-            "publication_year": "2014//",
-            "notes_abstract": "BACKGROUND: Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
-            "keywords": ["Pippi", "Nordwind", "Piraten"],
-            "alternate_title3": "Lorem",
-            "alternate_title2": "lorem",
-            "volume": "9",
-            "number": "3",
-            "start_page": "e0815",
-            "place_published": "United States",
-            "publisher": "Fun Factory",
-            "issn": "1932-6208",
-            "note": "1008150341",
-            "file_attachments2": "http://example.com",
-            "urls": ["http://example_url.com"],
-        },
-        {
-            "type_of_reference": "JOUR",
-            "id": "12345",
-            "primary_title": "The title of the reference",
-            "first_authors": ["Marxus, Karlus", "Lindgren, Astrid"],
-            "secondary_authors": ["Glattauer, Daniel"],
-            "publication_year": "2006//",
-            "notes_abstract": "BACKGROUND: Lorem dammed ipsum dolor sit amet, consectetuer adipiscing elit. Aenean commodo ligula eget dolor. Aenean massa. Cum sociis natoque penatibus et magnis dis parturient montes, nascetur ridiculus mus.  RESULTS: Donec quam felis, ultricies nec, pellentesque eu, pretium quis, sem. Nulla consequat massa quis enim. CONCLUSIONS: Donec pede justo, fringilla vel, aliquet nec, vulputate eget, arcu. In enim justo, rhoncus ut, imperdiet a, venenatis vitae, justo. Nullam dictum felis eu pede mollis pretium.",  # noqa: E501
-            "keywords": ["Pippi Langstrumpf", "Nordwind", "Piraten"],
-            "alternate_title3": "Lorem",
-            "alternate_title2": "lorem",
-            "volume": "6",
-            "number": "3",
-            "start_page": "e0815341",
-            "place_published": "Germany",
-            "publisher": "Dark Factory",
-            "issn": "1732-4208",
-            "note": "1228150341",
-            "file_attachments2": "http://example2.com",
-            "urls": ["http://example_url.com"],
-        },
-    ]
-
-    with open(filepath) as f:
-        entries = rispy.load(f)
-    assert expected == entries
-
-
-def test_load_single_unknown_tag_ris():
-    filepath = DATA_DIR / "example_single_unknown_tag.ris"
-    expected = {
-        "type_of_reference": "JOUR",
-        "authors": ["Shannon,Claude E."],
-        "year": "1948/07//",
-        "title": "A Mathematical Theory of Communication",
-        "alternate_title3": "Bell System Technical Journal",
-        "start_page": "379",
-        "end_page": "423",
-        "volume": "27",
-        "unknown_tag": {"JP": ["CRISPR", "Direct Current"]},
-    }
-
-    with open(filepath) as f:
-        entries = rispy.load(f)
-
-    assert expected == entries[0]
-
-
-def test_load_multiple_unknown_tags_ris():
-    filepath = DATA_DIR / "example_multi_unknown_tags.ris"
-    expected = {
-        "type_of_reference": "JOUR",
-        "authors": ["Shannon,Claude E."],
-        "year": "1948/07//",
-        "title": "A Mathematical Theory of Communication",
-        "alternate_title3": "Bell System Technical Journal",
-        "end_page": "423",
-        "volume": "27",
-        "unknown_tag": {"JP": ["CRISPR"], "DC": ["Direct Current"]},
-    }
-    with open(filepath) as f:
+@pytest.mark.parametrize(
+    "filename,kwargs",
+    [
+        pytest.param("example_full.ris", {}, id="full"),
+        pytest.param(
+            "example_extraneous_data.ris", {"skip_missing_tags": True}, id="extraneous_data"
+        ),
+        # Parse files without whitespace after ER tag.
+        # Resolves https://github.com/MrTango/rispy/pull/25
+        pytest.param("example_full_without_whitespace.ris", {}, id="without_whitespace"),
+    ],
+)
+def test_load_example_full_ris(filename, kwargs):
+    with open(DATA_DIR / filename) as f:
+        entries = rispy.load(f, **kwargs)
+    assert EXAMPLE_FULL_ENTRIES == entries
+
+
+@pytest.mark.parametrize(
+    "filename,expected",
+    [
+        pytest.param(
+            "multiline.ris",
+            {
+                "type_of_reference": "JOUR",
+                "authors": ["Shannon,Claude E."],
+                "year": "1948/07//",
+                "title": "A Mathematical Theory of Communication",
+                "alternate_title3": "Bell System Technical Journal",
+                "start_page": "379",
+                "end_page": "423",
+                "notes_abstract": "first line, then second line and at the end the last line",
+                "notes": ["first line", "* second line", "* last line"],
+                "volume": "27",
+            },
+            id="multiline",
+        ),
+        pytest.param(
+            "example_single_unknown_tag.ris",
+            {
+                "type_of_reference": "JOUR",
+                "authors": ["Shannon,Claude E."],
+                "year": "1948/07//",
+                "title": "A Mathematical Theory of Communication",
+                "alternate_title3": "Bell System Technical Journal",
+                "start_page": "379",
+                "end_page": "423",
+                "volume": "27",
+                "unknown_tag": {"JP": ["CRISPR", "Direct Current"]},
+            },
+            id="single_unknown_tag",
+        ),
+        pytest.param(
+            "example_multi_unknown_tags.ris",
+            {
+                "type_of_reference": "JOUR",
+                "authors": ["Shannon,Claude E."],
+                "year": "1948/07//",
+                "title": "A Mathematical Theory of Communication",
+                "alternate_title3": "Bell System Technical Journal",
+                "end_page": "423",
+                "volume": "27",
+                "unknown_tag": {"JP": ["CRISPR"], "DC": ["Direct Current"]},
+            },
+            id="multiple_unknown_tags",
+        ),
+    ],
+)
+def test_load_single_entry(filename, expected):
+    with open(DATA_DIR / filename) as f:
         entries = rispy.load(f)
     assert expected == entries[0]
 
@@ -378,3 +282,96 @@ def test_url_tag():
     assert entries[1]["urls"] == ["http://example.com", "http://www.example.com"]
     assert entries[2]["urls"] == ["http://example.com", "http://www.example.com"]
     assert entries[3]["urls"] == ["http://example.com", "http://www.example.com"]
+
+
+def test_ris_is_tag():
+    parser = rispy.RisParser()
+    pattern = re.compile(rispy.RisParser.PATTERN)
+    lines = [
+        "TY  - JOUR",
+        "A1  - Marx, Karl",
+        "ER  - ",
+        "ER  -",
+        "ER  -\n",
+        "ER  -  \r\n",
+        "ER  - trailing",
+        "ER",
+        "ER -",
+        "1.",
+        "ty  - JOUR",
+        "1Y  - digit first",
+        "TY - JOUR",
+        "TY  -JOUR",
+        "  - ",
+        "continued line",
+        "",
+    ]
+    for line in lines:
+        assert parser.is_tag(line) is bool(pattern.match(line)), line
+
+
+def test_wos_is_tag():
+    parser = rispy.WokParser()
+    pattern = re.compile(rispy.WokParser.PATTERN)
+    lines = [
+        "PT J",
+        "AU Parkes-Loach, PS",
+        "C1 Washington Univ",
+        "ER",
+        "ER\n",
+        "EF",
+        "ERR",
+        "   Majeed, AP",
+        "au lowercase",
+        "1A digit first",
+        "A",
+        "AB",
+        "AB\tTab",
+        "",
+    ]
+    for line in lines:
+        assert parser.is_tag(line) is bool(pattern.match(line)), line
+
+
+def test_iload():
+    filepath = DATA_DIR / "example_full.ris"
+
+    with open(filepath) as f:
+        entries = rispy.iload(f)
+        assert not isinstance(entries, list)
+        assert list(entries) == EXAMPLE_FULL_ENTRIES
+
+    entries = rispy.iload(filepath)
+    assert next(entries) == EXAMPLE_FULL_ENTRIES[0]
+    assert list(entries) == EXAMPLE_FULL_ENTRIES[1:]
+
+    with pytest.raises(ValueError, match="File must be a file-like object"):
+        rispy.iload(123)
+
+
+def test_ris_custom_pattern():
+    class LowercaseTagParser(rispy.RisParser):
+        PATTERN = r"^[A-Za-z][A-Za-z0-9]  - |^ER  -\s*$"
+
+    text = "TY  - JOUR\nTI  - x\nab  - lower\nER  - \n"
+    entries = rispy.loads(text, implementation=LowercaseTagParser)
+    assert entries == [
+        {"type_of_reference": "JOUR", "title": "x", "unknown_tag": {"ab": ["lower"]}}
+    ]
+
+
+def test_wos_custom_pattern():
+    class LowercaseTagParser(rispy.WokParser):
+        PATTERN = r"^[A-Za-z][A-Za-z0-9] |^ER\s?|^EF\s?"
+
+    text = "PT J\nTI x\nab lower\nER\nEF\n"
+    entries = rispy.loads(text, implementation=LowercaseTagParser, skip_unknown_tags=True)
+    assert entries == [{"publication_type": "J", "document_title": "x"}]
+
+
+def test_mapping_read_once():
+    parser = rispy.RisParser(mapping=dict(rispy.TAG_KEY_MAPPING))
+    parser.mapping["XX"] = "custom"
+
+    entries = parser.parse("TY  - JOUR\nXX  - v\nER  - \n")
+    assert entries == [{"type_of_reference": "JOUR", "unknown_tag": {"XX": ["v"]}}]
@@ -0,0 +1,15 @@
+import pytest
+
+from rispy.utils import invert_dictionary
+
+
+def test_invert_dictionary():
+    assert invert_dictionary({"TY": "type_of_reference", "AU": "authors"}) == {
+        "type_of_reference": "TY",
+        "authors": "AU",
+    }
+
+
+def test_invert_dictionary_failure():
+    with pytest.raises(ValueError, match="some values were not unique"):
+        invert_dictionary({"A1": "authors", "AU": "authors"})
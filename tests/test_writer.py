@@ -1,4 +1,4 @@
-from copy import deepcopy
+import warnings
 from pathlib import Path
 from typing import ClassVar, List
 
@@ -52,8 +52,7 @@ def test_dumps_multiple_unknown_tags_ris(tmp_path):
 
 def test_custom_list_tags():
     filepath = DATA_DIR / "example_custom_list_tags.ris"
-    list_tags = deepcopy(rispy.LIST_TYPE_TAGS)
-    list_tags.append("SN")
+    list_tags = [*rispy.LIST_TYPE_TAGS, "SN"]
 
     expected = {
         "type_of_reference": "JOUR",
@@ -235,3 +234,87 @@ def test_delimited_dump():
     assert lines[3] == "AU  - Doe, John"
     assert lines[7] == "UR  - https://example.com,https://example2.com"
     assert len(lines) == 9
+
+
+def test_custom_pattern():
+    class CustomWriter(rispy.RisWriter):
+        PATTERN = "<{tag}>{{{value}}}"
+
+    entries = [{"type_of_reference": "JOUR", "title": "my-title"}]
+    lines = rispy.dumps(entries, implementation=CustomWriter).splitlines()
+    assert lines[1:] == ["<TY>{JOUR}", "<TI>{my-title}", "<ER>{}"]
+
+
+def test_custom_format_line():
+    class CustomWriter(rispy.RisWriter):
+        def _format_line(self, tag, value=""):
+            return f"<<{tag}={value}>>"
+
+    entries = [{"type_of_reference": "JOUR", "title": "t", "authors": ["a"]}]
+    lines = rispy.dumps(entries, implementation=CustomWriter).splitlines()
+    assert lines[1:] == ["<<TY=JOUR>>", "<<TI=t>>", "<<AU=a>>", "<<ER=>>"]
+
+
+def test_format_spec_pattern():
+    class PaddedWriter(rispy.RisWriter):
+        PATTERN = "{tag:<4}- {value}"
+
+    class ReversedWriter(rispy.RisWriter):
+        PATTERN = "{value} <- {tag}"
+
+    entries = [{"type_of_reference": "JOUR", "title": "my-title", "keywords": ["a", "b"]}]
+    lines = rispy.dumps(entries, implementation=PaddedWriter).splitlines()
+    assert lines[1:] == ["TY  - JOUR", "TI  - my-title", "KW  - a", "KW  - b", "ER  - "]
+
+    lines = rispy.dumps(entries, implementation=ReversedWriter).splitlines()
+    assert lines[1:] == ["JOUR <- TY", "my-title <- TI", "a <- KW", "b <- KW", " <- ER"]
+
+
+def test_dump_label_case_insensitive():
+    entries = [{"type_of_reference": "JOUR", "Title": "my-title", "ABSTRACT": "my-abstract"}]
+    lines = rispy.dumps(entries).splitlines()
+    assert lines[2:4] == ["TI  - my-title", "AB  - my-abstract"]
+
+
+def test_reference_type():
+    entries = [{"title": "my-title"}]
+    assert rispy.dumps(entries).splitlines()[1] == "TY  - JOUR"
+
+    missing = [{"type_of_reference": None, "title": "my-title"}]
+    assert rispy.dumps(missing).splitlines()[1] == "TY  - JOUR"
+
+    class CustomWriter(rispy.RisWriter):
+        DEFAULT_REFERENCE_TYPE = None
+
+    with pytest.raises(ValueError, match="Unknown type of reference"):
+        rispy.dumps(entries, implementation=CustomWriter)
+
+
+def test_dumps_iterable():
+    entries = [
+        {"type_of_reference": "JOUR", "title": "first"},
+        {"type_of_reference": "BOOK", "title": "second"},
+    ]
+    expected = "1.\nTY  - JOUR\nTI  - first\nER  - \n\n2.\nTY  - BOOK\nTI  - second\nER  - \n"
+    assert rispy.dumps(entry for entry in entries) == expected
+
+
+def test_unknown_label_warns_once():
+    entries = [
+        {"type_of_reference": "JOUR", "does_not_exists": "a"},
+        {"type_of_reference": "JOUR", "does_not_exists": "b"},
+    ]
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        rispy.dumps(entries)
+    assert [str(w.message) for w in caught] == ["label `does_not_exists` not exported"]
+
+
+def test_iter_format():
+    entries = rispy.loads((DATA_DIR / "example_full.ris").read_text())
+    chunks = list(rispy.RisWriter().iter_format(entries))
+    assert len(chunks) == 2
+    assert all(chunk.endswith("\n") for chunk in chunks)
+    assert chunks[0].startswith("1.\nTY  - JOUR\n")
+    assert chunks[1].startswith("\n2.\nTY  - JOUR\n")
+    assert "".join(chunks) == rispy.dumps(entries)